@@ -0,0 +1,15 @@
+
+"""Builds the Cython simulation kernel next to the modules
+
+Run 'python setup.py build_ext --inplace' in this folder
+before running simBackorder.py or simLostSales.py
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(ext_modules=cythonize(
+    [Extension("simKernel", ["simKernel.pyx"], extra_compile_args=["-O3", "-march=native"])]))
@@ -0,0 +1,51 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+It is assumed that any unfulfilled order is backordered
+and is fulfilled whenever the material is available in the
+inventory.  The service level is estimated based on how
+late the order was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+This is the Numba day-by-day recurrence written as a Cython
+extension (simKernel.pyx), for environments where Numba is
+not available.  Build it first with
+'python setup.py build_ext --inplace'
+
+The model itself is implemented in simInventory.py
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+import numpy as np
+from simInventory import simulateReplications
+
+
+######## Main statements to call simulation ########
+meanDemand = 500.0
+demandStdDev = 100.0
+minLeadTime = 7
+maxLeadTime = 13
+CS = 5000.0
+ROQ = 6000.0
+ROP = max(CS,ROQ)
+initialInv = ROP + ROQ
+
+# Simulate
+replications = 100
+sL = simulateReplications(replications, 0, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime,
+                          backorder=True)
+
+sLevel = np.array(sL)
+print("Avg. service level: " + str(np.mean(sLevel)))
+print("Service level standard deviation: " + str(np.std(sLevel)))
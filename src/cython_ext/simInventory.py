@@ -0,0 +1,80 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+This is the Numba day-by-day recurrence written as a Cython
+extension (simKernel.pyx), for environments where Numba is
+not available.  Build it first with
+'python setup.py build_ext --inplace'
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from simKernel import simulate
+
+# Stocking facility class
+# it only holds the facility parameters and the stocking
+# metrics returned by the compiled simulation kernel
+class stockingFacility(object):
+
+    # initialize the new facility object
+    def __init__(self, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+        self.on_hand_inventory = initialInv
+        self.inventory_position = initialInv
+        self.ROP = ROP
+        self.ROQ = ROQ
+        self.meanDemand = meanDemand
+        self.demandStdDev = demandStdDev
+        self.minLeadTime = minLeadTime
+        self.maxLeadTime = maxLeadTime
+        self.backorder = backorder  # True if unfulfilled orders are backordered, False if they are lost
+        self.totalDemand = 0.0
+        self.totalShipped = 0.0
+        self.totalBackOrder = 0.0
+        self.totalLateSales = 0.0
+        self.serviceLevel = 0.0
+
+
+# Simulation module
+def simulateNetwork(seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    s = stockingFacility(initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+    (s.on_hand_inventory, s.inventory_position, s.totalDemand, s.totalShipped,
+     s.totalBackOrder, s.totalLateSales) = simulate(
+        float(initialInv), float(ROP), float(ROQ), float(meanDemand), float(demandStdDev),
+        int(minLeadTime), int(maxLeadTime), seedinit, bool(backorder))  # simulate for 1 year
+    if backorder:
+        s.serviceLevel = 1 - s.totalLateSales / s.totalDemand
+    else:
+        s.serviceLevel = s.totalShipped / s.totalDemand
+    return s
+
+
+# returns the service level of every replication
+# a compiled replication takes microseconds, far less than sending
+# it to a worker process, so the replications are run serially
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    sL = []
+    for i in range(replications):
+        nodes = simulateNetwork(seedinit + i, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+        sL.append(nodes.serviceLevel)
+    return sL
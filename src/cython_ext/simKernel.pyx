@@ -0,0 +1,127 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+
+"""This module provides the compiled simulation kernel used by
+simInventory.py when Numba is not available
+
+The kernel is the day-by-day recurrence of the Numba module
+written with typed C locals.  Random numbers come from the same
+PCG32 generator and inverse-CDF Normal sampling, so for a given
+seed they follow the same random stream as the Numba kernel
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from libc.math cimport sqrt, log
+from libc.stdint cimport uint32_t, uint64_t
+from libc.stdlib cimport calloc, free
+
+
+# PCG32 random number generator (XSH-RR variant)
+cdef struct pcgState:
+    uint64_t state
+    uint64_t inc
+
+cdef inline uint32_t _pcgNext(pcgState* rng) noexcept nogil:
+    cdef uint64_t oldState = rng.state
+    cdef uint32_t xorShifted, rot
+    rng.state = oldState * 6364136223846793005ULL + rng.inc
+    xorShifted = <uint32_t>(((oldState >> 18) ^ oldState) >> 27)
+    rot = <uint32_t>(oldState >> 59)
+    return (xorShifted >> rot) | (xorShifted << ((32 - rot) & 31))
+
+cdef inline void _pcgSeed(pcgState* rng, uint64_t seedinit) noexcept nogil:
+    rng.state = 0
+    rng.inc = (seedinit << 1) | 1
+    _pcgNext(rng)
+    rng.state += 0x853C49E6748FEA9BULL
+    _pcgNext(rng)
+
+# uniform random number in the open interval (0, 1)
+cdef inline double _pcgUniform(pcgState* rng) noexcept nogil:
+    return (<double>_pcgNext(rng) + 0.5) * 2.3283064365386963e-10  # 2**-32
+
+
+# inverse of the standard Normal CDF, after Acklam's rational
+# approximation (relative error below 1.2e-9)
+cdef double _PPF_A[6]
+cdef double _PPF_B[5]
+cdef double _PPF_C[6]
+cdef double _PPF_D[4]
+_PPF_A[:] = [-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+             1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00]
+_PPF_B[:] = [-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+             6.680131188771972e+01, -1.328068155288572e+01]
+_PPF_C[:] = [-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+             -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00]
+_PPF_D[:] = [7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+             3.754408661907416e+00]
+cdef double _PPF_LOW = 0.02425
+
+cdef inline double _normPpf(double u) noexcept nogil:
+    cdef double *a = _PPF_A
+    cdef double *b = _PPF_B
+    cdef double *c = _PPF_C
+    cdef double *d = _PPF_D
+    cdef double q, r
+    if u < _PPF_LOW:  # lower tail
+        q = sqrt(-2.0 * log(u))
+        return (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+               ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+    if u > 1.0 - _PPF_LOW:  # upper tail
+        q = sqrt(-2.0 * log(1.0 - u))
+        return -(((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+                ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+    q = u - 0.5  # central region
+    r = q * q
+    return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+           (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
+
+
+# simulation kernel
+# steps through the days 1..364, which are the days SimPy
+# processes when the simulation is run until day 365
+def simulate(double initialInv, double ROP, double ROQ, double meanDemand, double demandStdDev,
+             int minLeadTime, int maxLeadTime, uint64_t seedinit, bint backorder):
+    cdef pcgState rng
+    cdef double on_hand_inventory = initialInv
+    cdef double inventory_position = initialInv
+    cdef double totalDemand = 0.0
+    cdef double totalShipped = 0.0
+    cdef double totalBackOrder = 0.0
+    cdef double totalLateSales = 0.0
+    cdef double reorderLevel = 1.01 * ROP  # multiply by 1.01 to avoid rounding issues
+    cdef double demand, shipment, shortfall
+    cdef int t, reorder, leadTime, delay
+    cdef double *arrivals
+    # the lead times index the arrivals array, so they are checked before it is allocated
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    arrivals = <double *>calloc(365 + maxLeadTime, sizeof(double))  # quantity delivered on each day
+    if arrivals == NULL:
+        raise MemoryError()
+    _pcgSeed(&rng, seedinit)
+    with nogil:
+        for t in range(1, 365):
+            on_hand_inventory += arrivals[t]  # receive the orders first, as SimPy does
+            demand = meanDemand + demandStdDev * _normPpf(_pcgUniform(&rng))
+            totalDemand += demand
+            shipment = min(demand + totalBackOrder, on_hand_inventory)  # no backorder builds up when sales are lost
+            totalShipped += shipment
+            on_hand_inventory -= shipment
+            inventory_position -= shipment
+            if backorder:
+                shortfall = demand - shipment
+                totalBackOrder += shortfall
+                totalLateSales += max(0.0, shortfall)
+            # the reorder decision is applied as a 0/1 factor rather than a branch
+            # when no order is placed, nothing is added to today's (already received) slot
+            reorder = inventory_position <= reorderLevel
+            leadTime = minLeadTime + <int>(_pcgUniform(&rng) * (maxLeadTime - minLeadTime))
+            # SimPy delivers orders with a lead time of 0 or 1 day after that day's
+            # demand, so they are only received at the start of the following day
+            delay = leadTime + (leadTime < 2)
+            arrivals[t + delay * reorder] += ROQ * reorder
+            inventory_position += ROQ * reorder
+    free(arrivals)
+    return on_hand_inventory, inventory_position, totalDemand, totalShipped, totalBackOrder, totalLateSales
@@ -0,0 +1,196 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+The model only has a daily demand event and the arrivals of
+the outstanding orders, so instead of SimPy the events are
+kept in a plain heapq priority queue of (day, event) tuples
+
+Until the next order arrives, the days on which the full demand
+is shipped and no order is placed follow a linear recurrence,
+so they are simulated in one step from the cumulative demand
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+import heapq
+from bisect import bisect_left
+from itertools import accumulate
+import numpy as np
+from joblib import Parallel, delayed
+
+# event types, order arrivals sort before the daily demand
+# of the same day so the orders are received first, as in SimPy
+ARRIVAL = 0
+TICK = 1
+
+# the days up to the next arrival are only collapsed when there are at
+# least this many of them, below that the per-day logic is cheaper
+MIN_COLLAPSE_DAYS = 4
+
+# Stocking facility class
+class stockingFacility(object):
+
+    # initialize the new facility object
+    def __init__(self, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, dailyDemand, leadTimes, backorder):
+        self.on_hand_inventory = initialInv
+        self.inventory_position = initialInv
+        self.ROP = ROP
+        self.ROQ = ROQ
+        self.reorderLevel = 1.01 * ROP  # multiply by 1.01 to avoid rounding issues
+        self.meanDemand = meanDemand
+        self.demandStdDev = demandStdDev
+        self.minLeadTime = minLeadTime
+        self.maxLeadTime = maxLeadTime
+        self.backorder = backorder  # True if unfulfilled orders are backordered, False if they are lost
+        self.dailyDemand = dailyDemand  # demand pre-sampled for each day of the year
+        self.cumDemand = list(accumulate(dailyDemand, initial=0.0))  # demand up to each day
+        self.sortedDemand = min(dailyDemand) >= 0.0  # True if cumDemand is non-decreasing
+        self.leadTimes = leadTimes  # lead time pre-sampled for each order
+        self.day = 0
+        self.orderCount = 0
+        self.totalDemand = 0.0
+        self.totalShipped = 0.0
+        self.totalBackOrder = 0.0
+        self.totalLateSales = 0.0
+        self.serviceLevel = 0.0
+
+    # main subroutine for facility operation
+    # it processes the events before day 'until' and
+    # records all stocking metrics for the facility
+    # the state is kept in local variables, which are much cheaper
+    # to access than attributes, and written back once at the end
+    def runOperation(self, until):
+        heappush, heappop = heapq.heappush, heapq.heappop
+        backorder = self.backorder
+        dailyDemand = self.dailyDemand
+        cumDemand = self.cumDemand
+        sortedDemand = self.sortedDemand
+        leadTimes = self.leadTimes
+        reorderLevel = self.reorderLevel
+        ROQ = self.ROQ
+        on_hand_inventory = self.on_hand_inventory
+        inventory_position = self.inventory_position
+        totalDemand = self.totalDemand
+        totalShipped = self.totalShipped
+        totalBackOrder = self.totalBackOrder
+        totalLateSales = self.totalLateSales
+        day = self.day
+        orderCount = self.orderCount
+        # False after a failed or partial attempt to collapse, until an order is
+        # received or placed; until then the next attempt would fail as well
+        collapse = True
+        events = [(1, TICK)]
+        while events and events[0][0] < until:
+            t, event = heappop(events)
+            if event == ARRIVAL:
+                on_hand_inventory += ROQ
+                collapse = True
+                continue
+            # collapse the days up to the next arrival that ship their full demand
+            # without placing an order, the first day that does not is simulated below
+            horizon = min(events[0][0], until) if collapse and events else until
+            if collapse and horizon - t >= MIN_COLLAPSE_DAYS:
+                # find the first day whose cumulative demand reaches the threshold
+                threshold = cumDemand[day] + min(on_hand_inventory, inventory_position - reorderLevel) - totalBackOrder
+                end = day + 1 + horizon - t
+                if sortedDemand:
+                    k = bisect_left(cumDemand, threshold, day + 1, end)
+                else:
+                    # a negative draw makes cumDemand non-monotonic, so scan it instead
+                    k = day + 1
+                    while k < end and cumDemand[k] < threshold:
+                        k += 1
+                days = k - day - 1
+                if days > 0:
+                    # when the block stops short of the next event, the following day
+                    # is the one that crosses the threshold
+                    collapse = days == horizon - t
+                    blockDemand = cumDemand[k - 1] - cumDemand[day]
+                    day += days
+                    totalDemand += blockDemand
+                    totalShipped += blockDemand + totalBackOrder
+                    on_hand_inventory -= blockDemand + totalBackOrder
+                    inventory_position -= blockDemand + totalBackOrder
+                    totalBackOrder = 0.0  # any backorder is filled on the first day
+                    heappush(events, (t + days, TICK))
+                    continue
+                collapse = False
+            demand = dailyDemand[day]
+            day += 1
+            totalDemand += demand
+            shipment = min(demand + totalBackOrder, on_hand_inventory)  # no backorder builds up when sales are lost
+            totalShipped += shipment
+            on_hand_inventory -= shipment
+            inventory_position -= shipment
+            if backorder:
+                shortfall = demand - shipment
+                totalBackOrder += shortfall
+                totalLateSales += max(0.0, shortfall)
+            if inventory_position <= reorderLevel:
+                leadTime = leadTimes[orderCount]
+                orderCount += 1
+                # the order is delivered leadTime days from today; one with a lead time
+                # of 0 or 1 day arrives after that day's demand in SimPy, so it is
+                # received a day later
+                delay = leadTime if leadTime >= 2 else leadTime + 1
+                heappush(events, (t + delay, ARRIVAL))
+                inventory_position += ROQ
+                collapse = True
+            heappush(events, (t + 1, TICK))
+        self.on_hand_inventory = on_hand_inventory
+        self.inventory_position = inventory_position
+        self.totalDemand = totalDemand
+        self.totalShipped = totalShipped
+        self.totalBackOrder = totalBackOrder
+        self.totalLateSales = totalLateSales
+        self.day = day
+        self.orderCount = orderCount
+
+
+# Simulation module
+def simulateNetwork(rng, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    # sample the demand for all days and a lead time for every possible order upfront
+    # at most one order is placed per day, so 365 lead times are always sufficient
+    dailyDemand = rng.normal(meanDemand, demandStdDev, 365).tolist()
+    leadTimes = rng.integers(minLeadTime, maxLeadTime, 365).tolist()
+    s = stockingFacility(initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, dailyDemand, leadTimes, backorder)
+    s.runOperation(until=365)  # simulate for 1 year
+    if backorder:
+        s.serviceLevel = 1 - s.totalLateSales / s.totalDemand
+    else:
+        s.serviceLevel = s.totalShipped / s.totalDemand
+    return s
+
+
+# returns the service level of every replication
+# replications are independent, so they are run in parallel on all cores
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    # one independent random stream per replication
+    rngs = [np.random.default_rng(seq) for seq in np.random.SeedSequence(seedinit).spawn(replications)]
+    results = Parallel(n_jobs=-1, backend="loky")(
+        delayed(simulateNetwork)(rng, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+        for rng in rngs)
+    return [nodes.serviceLevel for nodes in results]
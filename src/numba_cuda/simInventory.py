@@ -0,0 +1,105 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+All replications are simulated at once on the GPU by a
+CUDA kernel compiled with Numba, one thread per replication.
+Each thread has its own xoroshiro128+ random stream and
+keeps its outstanding orders in a small local ring buffer
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from numba import cuda, float32
+from numba.cuda.random import create_xoroshiro128p_states
+from numba.cuda.random import xoroshiro128p_normal_float32, xoroshiro128p_uniform_float32
+import math
+import numpy as np
+
+ARRIVAL_SLOTS = 16  # size of the per-thread ring buffer, must exceed maxLeadTime
+THREADS_PER_BLOCK = 128
+
+
+# simulation kernel, each thread simulates 1 year of one replication
+# it steps through the days 1..364, which are the days SimPy
+# processes when the simulation is run until day 365
+# the policy is the same for all threads, so branching on it does not diverge
+@cuda.jit
+def _simulate(rngStates, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder, serviceLevel):
+    tid = cuda.grid(1)
+    if tid >= serviceLevel.size:
+        return
+    arrivals = cuda.local.array(ARRIVAL_SLOTS, float32)  # quantity due on each of the coming days
+    for k in range(ARRIVAL_SLOTS):
+        arrivals[k] = 0.0
+    on_hand_inventory = initialInv
+    inventory_position = initialInv
+    totalDemand = float32(0.0)
+    totalShipped = float32(0.0)
+    totalBackOrder = float32(0.0)
+    totalLateSales = float32(0.0)
+    for t in range(1, 365):
+        slot = t % ARRIVAL_SLOTS
+        on_hand_inventory += arrivals[slot]  # receive the orders first, as SimPy does
+        arrivals[slot] = 0.0
+        demand = meanDemand + demandStdDev * xoroshiro128p_normal_float32(rngStates, tid)
+        totalDemand += demand
+        shipment = min(demand + totalBackOrder, on_hand_inventory)  # no backorder builds up when sales are lost
+        totalShipped += shipment
+        on_hand_inventory -= shipment
+        inventory_position -= shipment
+        if backorder:
+            shortfall = demand - shipment
+            totalBackOrder += shortfall
+            totalLateSales += max(float32(0.0), shortfall)
+        # the reorder decision is applied as a 0/1 factor rather than a branch, so the
+        # threads of a warp do not diverge; when no order is placed, nothing is added
+        # to today's (already received) slot
+        reorder = float32(1.0) if inventory_position <= float32(1.01) * ROP else float32(0.0)  # multiply by 1.01 to avoid rounding issues
+        u = xoroshiro128p_uniform_float32(rngStates, tid)
+        leadTime = minLeadTime + int(math.floor(u * (maxLeadTime - minLeadTime)))
+        # SimPy delivers orders with a lead time of 0 or 1 day after that day's
+        # demand, so they are only received at the start of the following day
+        delay = (leadTime + (1 if leadTime < 2 else 0)) * int(reorder)
+        arrivals[(t + delay) % ARRIVAL_SLOTS] += ROQ * reorder
+        inventory_position += ROQ * reorder
+    if backorder:
+        serviceLevel[tid] = 1 - totalLateSales / totalDemand
+    else:
+        serviceLevel[tid] = totalShipped / totalDemand
+
+
+# Simulation module
+# returns the service level of every replication
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    if maxLeadTime >= ARRIVAL_SLOTS:
+        raise ValueError("maxLeadTime must be less than %d" % ARRIVAL_SLOTS)
+    rngStates = create_xoroshiro128p_states(replications, seed=seedinit)  # one random stream per replication
+    serviceLevel = cuda.device_array(replications, dtype=np.float32)
+    blocks = (replications + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    _simulate[blocks, THREADS_PER_BLOCK](rngStates, np.float32(initialInv), np.float32(ROP), np.float32(ROQ),
+                                         np.float32(meanDemand), np.float32(demandStdDev),
+                                         minLeadTime, maxLeadTime, bool(backorder), serviceLevel)
+    return serviceLevel.copy_to_host()
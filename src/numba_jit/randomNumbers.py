@@ -0,0 +1,72 @@
+
+"""This module provides the random numbers used by the compiled
+simulation kernels of simBackorder.py and simLostSales.py
+
+Random numbers come from a PCG32 generator and Normal demand
+is drawn by inverse-CDF sampling, both written as small jitted
+functions that Numba inlines into the simulation loop
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from numba import njit
+import numpy as np
+
+
+# PCG32 random number generator (XSH-RR variant), small enough to be
+# inlined into the simulation kernel; the state is kept in a 2-element
+# array holding the generator state and its (odd) increment
+_PCG_MULTIPLIER = np.uint64(6364136223846793005)
+
+@njit(cache=True)
+def _pcgNext(rngState):
+    oldState = rngState[0]
+    rngState[0] = oldState * _PCG_MULTIPLIER + rngState[1]
+    xorShifted = ((oldState >> np.uint64(18)) ^ oldState) >> np.uint64(27)
+    xorShifted &= np.uint64(0xFFFFFFFF)
+    rot = oldState >> np.uint64(59)
+    return ((xorShifted >> rot) | (xorShifted << ((np.uint64(32) - rot) & np.uint64(31)))) & np.uint64(0xFFFFFFFF)
+
+@njit(cache=True)
+def pcgSeed(seedinit):
+    rngState = np.zeros(2, dtype=np.uint64)
+    rngState[1] = (np.uint64(seedinit) << np.uint64(1)) | np.uint64(1)
+    _pcgNext(rngState)
+    rngState[0] += np.uint64(0x853C49E6748FEA9B)
+    _pcgNext(rngState)
+    return rngState
+
+# uniform random number in the open interval (0, 1)
+@njit(cache=True)
+def pcgUniform(rngState):
+    return (float(_pcgNext(rngState)) + 0.5) * 2.3283064365386963e-10  # 2**-32
+
+
+# inverse of the standard Normal CDF, after Acklam's rational
+# approximation (relative error below 1.2e-9)
+_PPF_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+          1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_PPF_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+          6.680131188771972e+01, -1.328068155288572e+01)
+_PPF_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+          -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_PPF_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+          3.754408661907416e+00)
+_PPF_LOW = 0.02425
+
+@njit(cache=True)
+def normPpf(u):
+    a, b, c, d = _PPF_A, _PPF_B, _PPF_C, _PPF_D
+    if u < _PPF_LOW:  # lower tail
+        q = np.sqrt(-2.0 * np.log(u))
+        return (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+               ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+    if u > 1.0 - _PPF_LOW:  # upper tail
+        q = np.sqrt(-2.0 * np.log(1.0 - u))
+        return -(((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+                ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0)
+    q = u - 0.5  # central region
+    r = q * q
+    return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+           (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
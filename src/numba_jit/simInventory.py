@@ -0,0 +1,142 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+Since every event of the model happens on a whole day, the
+SimPy event loop is replaced by a day-by-day recurrence
+compiled with Numba.  Outstanding orders are kept in an
+array indexed by the day they arrive on
+
+Random numbers come from the jitted PCG32 generator and
+inverse-CDF Normal sampling in randomNumbers.py, which Numba
+inlines into the simulation loop
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+from numba import njit
+import numpy as np
+from randomNumbers import pcgSeed, pcgUniform, normPpf
+
+# Stocking facility class
+# it only holds the facility parameters and the stocking
+# metrics returned by the compiled simulation kernel
+class stockingFacility(object):
+
+    # initialize the new facility object
+    def __init__(self, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+        self.on_hand_inventory = initialInv
+        self.inventory_position = initialInv
+        self.ROP = ROP
+        self.ROQ = ROQ
+        self.meanDemand = meanDemand
+        self.demandStdDev = demandStdDev
+        self.minLeadTime = minLeadTime
+        self.maxLeadTime = maxLeadTime
+        self.backorder = backorder  # True if unfulfilled orders are backordered, False if they are lost
+        self.totalDemand = 0.0
+        self.totalShipped = 0.0
+        self.totalBackOrder = 0.0
+        self.totalLateSales = 0.0
+        self.serviceLevel = 0.0
+
+
+# compiled simulation kernels, one per (minLeadTime, maxLeadTime, backorder)
+_kernels = {}
+
+# returns the simulation kernel for the given lead time bounds and policy
+# these are compile-time constants of the kernel, so Numba can fold the
+# lead time range and the size of the arrivals array and drop the code
+# of the other policy
+def _getKernel(minLeadTime, maxLeadTime, backorder):
+    key = (minLeadTime, maxLeadTime, backorder)
+    if key not in _kernels:
+        _kernels[key] = _makeKernel(minLeadTime, maxLeadTime, backorder)
+    return _kernels[key]
+
+# the kernel steps through the days 1..364, which are the days
+# SimPy processes when the simulation is run until day 365
+# the on-disk cache is keyed on the closure variables as well
+def _makeKernel(minLeadTime, maxLeadTime, backorder):
+    leadTimeRange = maxLeadTime - minLeadTime
+
+    @njit(cache=True)
+    def _simulate(initialInv, ROP, ROQ, meanDemand, demandStdDev, seedinit):
+        rngState = pcgSeed(seedinit)
+        arrivals = np.zeros(365 + maxLeadTime)  # quantity delivered on each day
+        on_hand_inventory = initialInv
+        inventory_position = initialInv
+        totalDemand = 0.0
+        totalShipped = 0.0
+        totalBackOrder = 0.0
+        totalLateSales = 0.0
+        for t in range(1, 365):
+            on_hand_inventory += arrivals[t]  # receive the orders first, as SimPy does
+            demand = meanDemand + demandStdDev * normPpf(pcgUniform(rngState))
+            totalDemand += demand
+            shipment = min(demand + totalBackOrder, on_hand_inventory)  # no backorder builds up when sales are lost
+            totalShipped += shipment
+            on_hand_inventory -= shipment
+            inventory_position -= shipment
+            if backorder:
+                shortfall = demand - shipment
+                totalBackOrder += shortfall
+                totalLateSales += max(0.0, shortfall)
+            # the reorder decision is applied as a 0/1 factor rather than a branch
+            # when no order is placed, nothing is added to today's (already received) slot
+            reorder = 1 if inventory_position <= 1.01 * ROP else 0  # multiply by 1.01 to avoid rounding issues
+            leadTime = minLeadTime + int(pcgUniform(rngState) * leadTimeRange)
+            # SimPy delivers orders with a lead time of 0 or 1 day after that day's
+            # demand, so they are only received at the start of the following day
+            delay = leadTime + (1 if leadTime < 2 else 0)
+            arrivals[t + delay * reorder] += ROQ * reorder
+            inventory_position += ROQ * reorder
+        return on_hand_inventory, inventory_position, totalDemand, totalShipped, totalBackOrder, totalLateSales
+    return _simulate
+
+
+# Simulation module
+def simulateNetwork(seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    s = stockingFacility(initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+    (s.on_hand_inventory, s.inventory_position, s.totalDemand, s.totalShipped,
+     s.totalBackOrder, s.totalLateSales) = _getKernel(int(minLeadTime), int(maxLeadTime), bool(backorder))(
+        float(initialInv), float(ROP), float(ROQ), float(meanDemand), float(demandStdDev),
+        seedinit)  # simulate for 1 year
+    if backorder:
+        s.serviceLevel = 1 - s.totalLateSales / s.totalDemand
+    else:
+        s.serviceLevel = s.totalShipped / s.totalDemand
+    return s
+
+
+# returns the service level of every replication
+# a compiled replication takes microseconds, far less than sending
+# it to a worker process, so the replications are run serially
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    sL = []
+    for i in range(replications):
+        nodes = simulateNetwork(seedinit + i, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+        sL.append(nodes.serviceLevel)
+    return sL
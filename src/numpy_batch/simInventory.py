@@ -0,0 +1,83 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+All replications are simulated at once with plain NumPy.
+The state of the facility is held in arrays with one entry
+per replication, so every day is a handful of vector
+operations over all replications
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+import numpy as np
+
+
+# Simulation module
+# steps through the days 1..364, which are the days SimPy
+# processes when the simulation is run until day 365
+# returns the service level of every replication
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    rng = np.random.default_rng(seedinit)
+    # the state is kept in float32, which is ample for inventory quantities
+    # and halves the memory traffic of the daily vector operations
+    meanDemand, demandStdDev, ROQ = np.float32(meanDemand), np.float32(demandStdDev), np.float32(ROQ)
+    replication = np.arange(replications)
+    arrivals = np.zeros((365 + maxLeadTime, replications), dtype=np.float32)  # quantity delivered on each day
+    on_hand_inventory = np.full(replications, initialInv, dtype=np.float32)
+    inventory_position = on_hand_inventory.copy()
+    reorderLevel = 1.01 * ROP  # multiply by 1.01 to avoid rounding issues
+    totalDemand = np.zeros(replications, dtype=np.float32)
+    totalShipped = np.zeros(replications, dtype=np.float32)
+    totalBackOrder = np.zeros(replications, dtype=np.float32)
+    totalLateSales = np.zeros(replications, dtype=np.float32)
+    for t in range(1, 365):
+        on_hand_inventory += arrivals[t]  # receive the orders first, as SimPy does
+        demand = meanDemand + demandStdDev * rng.standard_normal(replications, dtype=np.float32)
+        totalDemand += demand
+        if backorder:
+            shipment = np.minimum(demand + totalBackOrder, on_hand_inventory)
+        else:
+            shipment = np.minimum(demand, on_hand_inventory)
+        totalShipped += shipment
+        on_hand_inventory -= shipment
+        inventory_position -= shipment
+        if backorder:
+            shortfall = demand - shipment
+            totalBackOrder += shortfall
+            totalLateSales += np.maximum(0.0, shortfall)
+        reorder = inventory_position <= reorderLevel
+        ordering = replication[reorder]
+        leadTime = rng.integers(minLeadTime, maxLeadTime, ordering.size)
+        # SimPy delivers orders with a lead time of 0 or 1 day after that day's
+        # demand, so they are only received at the start of the following day
+        delay = leadTime + (leadTime < 2)
+        # each replication places at most one order per day, so the
+        # (day, replication) pairs are unique and can be updated in one go
+        arrivals[t + delay, ordering] += ROQ
+        inventory_position[reorder] += ROQ
+    if backorder:
+        return 1 - totalLateSales / totalDemand
+    return totalShipped / totalDemand
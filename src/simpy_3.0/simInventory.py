@@ -0,0 +1,172 @@
+
+"""This module simulates a single-echelon supply chain
+and calculates inventory profile (along with associated inventory
+parameters such as on-hand, inventory position, service level, etc.)
+across time
+
+The system follows a reorder point-reorder quantity policy
+If inventory position <= ROP, an order of a fixed reorder
+quantity (ROQ) is placed by the facility
+
+With backorder=True any unfulfilled order is backordered and
+is fulfilled whenever the material is available in the inventory.
+The service level is estimated based on how late the order was
+fulfilled.  With backorder=False any unfulfilled order is lost and
+the service level is estimated based on how much of the demand
+was fulfilled
+
+Demand is assumed to be Normally distributed
+Lead time is assumed to follow a uniform distribution
+
+simBackorder.py and simLostSales.py run this model
+for the two policies
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+import simpy
+import numpy as np
+from joblib import Parallel, delayed, cpu_count
+
+# Stocking facility class
+class stockingFacility(object):
+
+    # initialize the new facility object
+    def __init__(self, env, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, dailyDemand, leadTimes, backorder):
+        self.env = env
+        self.on_hand_inventory = initialInv
+        self.inventory_position = initialInv
+        self.ROP = ROP
+        self.ROQ = ROQ
+        self.reorderLevel = 1.01 * ROP  # multiply by 1.01 to avoid rounding issues
+        self.meanDemand = meanDemand
+        self.demandStdDev = demandStdDev
+        self.minLeadTime = minLeadTime
+        self.maxLeadTime = maxLeadTime
+        self.backorder = backorder  # True if unfulfilled orders are backordered, False if they are lost
+        self.dailyDemand = dailyDemand  # demand pre-sampled for each day of the year
+        self.leadTimes = leadTimes  # lead time pre-sampled for each order
+        self.day = 0
+        self.orderCount = 0
+        # quantity due to arrive on each of the coming days, stored as a
+        # ring buffer whose head is today; lead times never exceed maxLeadTime
+        self.inbound = np.zeros(maxLeadTime + 2)
+        self.inboundHead = 0
+        self.totalDemand = 0.0
+        self.totalShipped = 0.0
+        self.totalBackOrder = 0.0
+        self.totalLateSales = 0.0
+        self.serviceLevel = 0.0
+        env.process(self.runOperation())
+
+    # main subroutine for facility operation
+    # it records all stocking metrics for the facility
+    # it runs for the days 1..364, which are the days SimPy processes when
+    # the simulation is run until day 365, so it has finished by then
+    # the state is kept in local variables, which are much cheaper to access
+    # than attributes, and written back once at the end
+    def runOperation(self):
+        timeout = self.env.timeout
+        backorder = self.backorder
+        dailyDemand = self.dailyDemand
+        leadTimes = self.leadTimes
+        reorderLevel = self.reorderLevel
+        ROQ = self.ROQ
+        inbound = self.inbound
+        slots = len(inbound)
+        on_hand_inventory = self.on_hand_inventory
+        inventory_position = self.inventory_position
+        totalDemand = self.totalDemand
+        totalShipped = self.totalShipped
+        totalBackOrder = self.totalBackOrder
+        totalLateSales = self.totalLateSales
+        day = self.day
+        orderCount = self.orderCount
+        inboundHead = self.inboundHead
+        for _ in range(364):
+            yield timeout(1.0)
+            on_hand_inventory += inbound[inboundHead]  # receive today's orders
+            inbound[inboundHead] = 0.0
+            demand = dailyDemand[day]
+            day += 1
+            totalDemand += demand
+            shipment = min(demand + totalBackOrder, on_hand_inventory)  # no backorder builds up when sales are lost
+            totalShipped += shipment
+            on_hand_inventory -= shipment
+            inventory_position -= shipment
+            if backorder:
+                shortfall = demand - shipment
+                totalBackOrder += shortfall
+                totalLateSales += max(0.0, shortfall)
+            if inventory_position <= reorderLevel:
+                leadTime = leadTimes[orderCount]
+                orderCount += 1
+                # the order is delivered leadTime days from today; one with a lead time
+                # of 0 or 1 day arrives after that day's demand, as it did when every
+                # order was its own SimPy process, so it is received a day later
+                delay = leadTime if leadTime >= 2 else leadTime + 1
+                inbound[(inboundHead + delay) % slots] += ROQ
+                inventory_position += ROQ
+            inboundHead = (inboundHead + 1) % slots
+        self.on_hand_inventory = on_hand_inventory
+        self.inventory_position = inventory_position
+        self.totalDemand = totalDemand
+        self.totalShipped = totalShipped
+        self.totalBackOrder = totalBackOrder
+        self.totalLateSales = totalLateSales
+        self.day = day
+        self.orderCount = orderCount
+        self.inboundHead = inboundHead
+
+
+# Simulation module
+# simulates one replication per random number generator in rngs
+# all facilities share a single SimPy environment, so the cost of
+# setting up the environment is paid once for the whole batch
+def simulateNetworkMany(rngs, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    if minLeadTime < 0 or maxLeadTime <= minLeadTime:
+        raise ValueError("lead times must satisfy 0 <= minLeadTime < maxLeadTime")
+    env = simpy.Environment()  # initialize SimPy simulation instance
+    facilities = []
+    for rng in rngs:
+        # sample the demand for all days and a lead time for every possible order upfront
+        # at most one order is placed per day, so 365 lead times are always sufficient
+        dailyDemand = rng.normal(meanDemand, demandStdDev, 365)
+        leadTimes = rng.integers(minLeadTime, maxLeadTime, 365).tolist()
+        facilities.append(stockingFacility(env, initialInv, ROP, ROQ, meanDemand, demandStdDev,
+                                           minLeadTime, maxLeadTime, dailyDemand, leadTimes, backorder))
+    env.run(until=365)  # simulate for 1 year
+    for s in facilities:
+        if backorder:
+            s.serviceLevel = 1 - s.totalLateSales / s.totalDemand
+        else:
+            s.serviceLevel = s.totalShipped / s.totalDemand
+    return facilities
+
+
+# simulates a single replication
+def simulateNetwork(rng, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    return simulateNetworkMany([rng], initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)[0]
+
+
+# Service levels of a batch of replications
+# the facility objects hold the SimPy processes, which cannot be
+# sent back from a worker process, so only the service levels are returned
+def simulateServiceLevels(rngs, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    facilities = simulateNetworkMany(rngs, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+    return [s.serviceLevel for s in facilities]
+
+
+# returns the service level of every replication
+# replications are independent, so they are split into one batch
+# per core and the batches are run in parallel
+def simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder):
+    # one independent random stream per replication
+    rngs = [np.random.default_rng(seq) for seq in np.random.SeedSequence(seedinit).spawn(replications)]
+    nBatches = min(cpu_count(), replications)
+    batches = [rngs[k::nBatches] for k in range(nBatches)]
+    results = Parallel(n_jobs=-1, backend="loky")(
+        delayed(simulateServiceLevels)(batch, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime, backorder)
+        for batch in batches)
+    return [serviceLevel for batch in results for serviceLevel in batch]
@@ -0,0 +1,66 @@
+
+"""This module runs the single-echelon supply chain simulation
+with any of the backends in the folders next to it, through
+a single entry point
+
+Every backend folder holds a simInventory.py exposing the same
+simulateReplications function, which simBackorder.py and
+simLostSales.py in that folder call for the default parameters.
+simulate() picks the policy and the backend by name, e.g.
+
+    sL = simulate("lost", "numba", 100, 0, initialInv, ROP, ROQ,
+                  meanDemand, demandStdDev, minLeadTime, maxLeadTime)
+"""
+
+__author__ = 'Anshul Agarwal'
+
+
+import importlib.util
+import os
+import sys
+from cloudpickle import register_pickle_by_value  # the pickler of the joblib worker processes
+
+# folder of each backend
+BACKENDS = {
+    "simpy": "simpy_3.0",
+    "event_queue": "event_queue",
+    "numba": "numba_jit",
+    "cuda": "numba_cuda",
+    "numpy": "numpy_batch",
+    "cython": "cython_ext",
+}
+
+# backorder flag of each policy
+POLICIES = {"backorder": True, "lost": False}
+
+# simInventory module of each backend loaded so far
+_modules = {}
+
+# returns the simInventory module of the given backend
+# all of them are named simInventory, the name the Numba cache and the
+# worker processes look them up by, so the one in sys.modules is
+# switched to the backend that is about to run
+def _getBackend(backend):
+    if backend not in BACKENDS:
+        raise ValueError("backend must be one of " + ", ".join(BACKENDS))
+    if backend not in _modules:
+        folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), BACKENDS[backend])
+        sys.path.append(folder)  # for the modules the backend imports from its own folder
+        spec = importlib.util.spec_from_file_location("simInventory", os.path.join(folder, "simInventory.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["simInventory"] = module
+        spec.loader.exec_module(module)
+        _modules[backend] = module
+    sys.modules["simInventory"] = _modules[backend]
+    # workers cannot tell the backends apart by name, so they are sent the functions themselves
+    register_pickle_by_value(_modules[backend])
+    return _modules[backend]
+
+
+# Simulation module
+# returns the service level of every replication
+def simulate(policy, backend, replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev, minLeadTime, maxLeadTime):
+    if policy not in POLICIES:
+        raise ValueError("policy must be one of " + ", ".join(POLICIES))
+    return _getBackend(backend).simulateReplications(replications, seedinit, initialInv, ROP, ROQ, meanDemand, demandStdDev,
+                                                     minLeadTime, maxLeadTime, POLICIES[policy])